@@ -0,0 +1,46 @@
+# backend.py
+# 대시보드 로더가 사용하는 시트 백엔드 인터페이스와 gspread 구현
+from gspread.exceptions import APIError
+
+
+class BackendError(Exception):
+    """백엔드 요청 실패 (status 는 HTTP 상태 코드, 429 = 호출 한도 초과)"""
+
+    def __init__(self, status, message):
+        super().__init__(f"[{status}] {message}")
+        self.status = status
+
+
+class SheetsBackend:
+    """
+    로더는 이 두 가지 요청만 사용한다.
+    revision(key): 스프레드시트의 Drive modifiedTime
+    batch_get(key, ranges): A1 범위 목록 -> 범위별 값 (행 끝의 빈 셀은 잘린 ragged 행 목록)
+    """
+
+    def revision(self, key):
+        raise NotImplementedError
+
+    def batch_get(self, key, ranges):
+        raise NotImplementedError
+
+
+class GspreadBackend(SheetsBackend):
+    """OAuth 인증된 gspread 클라이언트로 실제 구글 시트에 요청"""
+
+    def __init__(self, client):
+        self.client = client
+
+    def revision(self, key):
+        try:
+            return self.client.get_file_drive_metadata(key)["modifiedTime"]
+        except APIError as e:
+            raise BackendError(e.response.status_code, str(e)) from e
+
+    def batch_get(self, key, ranges):
+        try:
+            response = self.client.http_client.values_batch_get(key, list(ranges))
+        except APIError as e:
+            raise BackendError(e.response.status_code, str(e)) from e
+        value_ranges = response.get("valueRanges", [])
+        return [value_range.get("values", []) for value_range in value_ranges]
@@ -0,0 +1,170 @@
+# dataset.py
+# 대시보드 데이터 묶음(Dataset)과 백그라운드 갱신 스레드
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from types import MappingProxyType
+
+
+@dataclass(frozen=True)
+class Dataset:
+    """
+    한 번의 로드로 만들어진 불변 데이터 묶음.
+    페이지 코드는 frames 의 DataFrame 을 읽기만 하고 수정하지 않는다.
+    """
+    version: int
+    loaded_at: float
+    frames: MappingProxyType
+    timings: MappingProxyType = field(default_factory=lambda: MappingProxyType({}))
+    errors: MappingProxyType = field(default_factory=lambda: MappingProxyType({}))
+
+    def get(self, name):
+        return self.frames.get(name)
+
+    def memory_usage(self):
+        """시트별 메모리 사용량 (bytes, 문자열 등 객체 값 포함)"""
+        return {
+            name: int(df.memory_usage(index=True, deep=True).sum())
+            for name, df in self.frames.items()
+            if df is not None
+        }
+
+
+class DatasetRegistry:
+    """
+    프로세스 전체가 공유하는 버전별 Dataset 보관소 (최근 keep 개 버전만 보관).
+    세션은 DataFrame 을 복사하지 않고 DatasetRefresher.current() 의 같은 객체를 읽는다.
+    """
+
+    def __init__(self, keep=3):
+        self.keep = keep
+        self._datasets = OrderedDict()
+        self._lock = threading.Lock()
+
+    def publish(self, dataset):
+        with self._lock:
+            self._datasets[dataset.version] = dataset
+            while len(self._datasets) > self.keep:
+                self._datasets.popitem(last=False)
+        return dataset
+
+    def memory_usage(self):
+        """{버전: {시트 이름: bytes}} (보관 중인 모든 버전)"""
+        with self._lock:
+            datasets = list(self._datasets.values())
+        return {dataset.version: dataset.memory_usage() for dataset in datasets}
+
+
+class DatasetRefresher:
+    """
+    interval 초마다 백그라운드 스레드에서 load() 를 실행하고,
+    새 Dataset 을 만들어 참조를 한 번에 교체한다 (stale-while-revalidate).
+    갱신 중에도 current() 는 직전 버전을 바로 돌려준다.
+
+    load() 는 sheet_loader.LoadResult 를 반환하는 함수.
+    새 버전은 registry(DatasetRegistry) 에도 등록된다.
+    on_load(result) 는 로드가 끝날 때마다 호출된다 (계측 기록 등, 실패해도 갱신에는 영향 없음).
+    모든 세션의 current() 요청이 이 스레드 하나의 로드 결과를 함께 쓰므로,
+    동시에 여러 세션이 열려도 시트 요청은 주기마다 한 번뿐이다 (loads / reads 로 집계).
+    첫 로드가 실패하면 last_error 에 남기고 retry_delay 초부터 두 배씩(최대 interval) 늘려 가며 다시 시도한다.
+    """
+
+    def __init__(self, load, interval=300, registry=None, on_load=None, retry_delay=5):
+        self._load = load
+        self._on_load = on_load
+        self.interval = interval
+        self.retry_delay = retry_delay
+        self.registry = registry if registry is not None else DatasetRegistry()
+        self._current = None
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self.refreshing = False
+        self.last_error = None
+        self.loads = 0
+        self.reads = 0
+        self._thread = threading.Thread(target=self._run, name="dataset-refresher", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def current(self, timeout=None):
+        """
+        현재 버전. 첫 로드가 끝나기 전이면 timeout 초까지 기다린다.
+        첫 로드가 실패한 뒤에는 기다리지 않고 None (다시 시도 중, 원인은 last_error)
+        """
+        with self._lock:
+            self.reads += 1
+        if self._current is None:
+            self._ready.wait(timeout)
+        return self._current
+
+    def stats(self):
+        """load() 실행 횟수와, 그 결과를 공유해 받은 current() 요청 횟수"""
+        with self._lock:
+            return {"loads": self.loads, "reads": self.reads}
+
+    # -----------------------------------------
+    # 백그라운드 루프
+    # -----------------------------------------
+    def _run(self):
+        delay = self.retry_delay
+        while True:
+            self._refresh_once()
+            if self._current is None:
+                # 아직 보여줄 버전이 없으면 interval 을 기다리지 않고 짧게 다시 시도
+                time.sleep(delay)
+                delay = min(delay * 2, self.interval)
+            else:
+                time.sleep(self.interval)
+
+    def _refresh_once(self):
+        self.refreshing = True
+        with self._lock:
+            self.loads += 1
+        try:
+            result = self._load()
+        except Exception as e:
+            print(f"데이터 갱신 오류: {e}")
+            self.last_error = str(e)
+            # 첫 로드를 기다리던 rerun 은 더 기다리지 않고 오류를 보여준다
+            self._ready.set()
+            return
+        finally:
+            self.refreshing = False
+        self.last_error = None
+
+        if self._on_load is not None:
+            try:
+                self._on_load(result)
+            except Exception as e:
+                print(f"로드 결과 기록 오류: {e}")
+
+        previous = self._current
+        changed = (
+            previous is None
+            or any(t.source != "snapshot" for t in result.timings.values())
+            or dict(result.errors) != dict(previous.errors)
+        )
+        if not changed:
+            return
+
+        frames = dict(result.frames)
+        if previous is not None:
+            # 이번에 실패한 시트는 직전 버전의 데이터를 계속 사용
+            for name in result.errors:
+                if frames.get(name) is None and previous.get(name) is not None:
+                    frames[name] = previous.get(name)
+
+        with self._lock:
+            version = 1 if previous is None else previous.version + 1
+            self._current = self.registry.publish(Dataset(
+                version=version,
+                loaded_at=time.time(),
+                frames=MappingProxyType(frames),
+                timings=MappingProxyType(dict(result.timings)),
+                errors=MappingProxyType(dict(result.errors)),
+            ))
+        self._ready.set()
+        print(f"데이터 버전 v{version} 적용\n{result.summary()}")
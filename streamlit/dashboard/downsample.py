@@ -0,0 +1,106 @@
+# downsample.py
+# 긴 시계열 차트용: 서버에서 점 줄이기(MinMax + LTTB), WebGL 전환, 눈금 개수 제한
+import numpy as np
+import plotly.graph_objects as go
+
+# 선 하나에 남길 최대 점 수 (대략 차트 가로 픽셀 수)
+TARGET_POINTS = 1000
+# 그림 전체 점 수가 이보다 많으면 SVG 대신 WebGL(Scattergl)로 그린다
+WEBGL_THRESHOLD = 5000
+# 가로축 눈금 최대 개수
+MAX_TICKS = 12
+
+
+def minmax_indices(y, buckets):
+    """y 를 buckets 개 구간으로 나눠 구간마다 최솟값 / 최댓값 위치만 남긴다 (정렬된 위치 배열)"""
+    n = len(y)
+    if n <= 2 * buckets:
+        return np.arange(n)
+    edges = np.linspace(0, n, buckets + 1).astype(int)
+    picked = [0, n - 1]
+    for lo, hi in zip(edges[:-1], edges[1:]):
+        if hi > lo:
+            segment = y[lo:hi]
+            picked.append(lo + int(np.argmin(segment)))
+            picked.append(lo + int(np.argmax(segment)))
+    return np.unique(picked)
+
+
+def lttb_indices(x, y, target):
+    """Largest-Triangle-Three-Buckets: 모양을 최대한 유지하면서 target 개 점의 위치를 고른다"""
+    n = len(y)
+    if target >= n or target < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, target - 1).astype(int)
+    picked = np.empty(target, dtype=int)
+    picked[0] = 0
+    picked[-1] = n - 1
+    a = 0
+    for i in range(target - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # 다음 구간의 평균점 (마지막 구간이면 마지막 점)
+        next_lo, next_hi = hi, edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[next_lo:next_hi].mean() if next_hi > next_lo else x[-1]
+        avg_y = y[next_lo:next_hi].mean() if next_hi > next_lo else y[-1]
+        if hi <= lo:
+            picked[i + 1] = lo
+            a = lo
+            continue
+        area = np.abs(
+            (x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a])
+        )
+        a = lo + int(np.argmax(area))
+        picked[i + 1] = a
+    return np.unique(picked)
+
+
+def downsample_indices(y, target=TARGET_POINTS):
+    """
+    결측이 아닌 점 중에서 남길 위치. 아주 긴 시계열은 MinMax 로 먼저 4*target 개로 줄인 뒤 LTTB 를 적용한다.
+    """
+    y = np.asarray(y, dtype="float64")
+    valid = np.flatnonzero(~np.isnan(y))
+    if len(valid) <= target:
+        return valid
+    candidates = valid
+    if len(valid) > 4 * target:
+        candidates = valid[minmax_indices(y[valid], 2 * target)]
+    chosen = lttb_indices(candidates.astype("float64"), y[candidates], target)
+    return candidates[chosen]
+
+
+def bounded_ticks(values, max_ticks=MAX_TICKS):
+    """눈금 후보(정렬된 값 목록)에서 고르게 최대 max_ticks 개를 고른다 (처음과 끝 포함)"""
+    values = list(values)
+    if len(values) <= max_ticks:
+        return values
+    step = int(np.ceil((len(values) - 1) / (max_ticks - 1)))
+    ticks = values[::step]
+    if ticks[-1] != values[-1]:
+        ticks[-1] = values[-1]
+    return ticks
+
+
+def optimize_line_figure(fig, target=TARGET_POINTS, webgl_threshold=WEBGL_THRESHOLD):
+    """
+    선 그래프(px.line)의 trace 마다 점이 target 개를 넘으면 서버에서 줄이고,
+    남은 점이 webgl_threshold 개를 넘으면 Scatter trace 를 Scattergl 로 바꾼다.
+    (customdata 를 쓰는 호버 포맷은 이 함수 뒤에 적용해야 점 수가 맞는다)
+    """
+    total = 0
+    for trace in fig.data:
+        if trace.y is None:
+            continue
+        y = np.asarray(trace.y, dtype="float64")
+        if len(y) > target:
+            keep = downsample_indices(y, target)
+            trace.x = np.asarray(trace.x, dtype=object)[keep]
+            trace.y = y[keep]
+        total += len(trace.y)
+
+    if total > webgl_threshold:
+        fig.data = [
+            go.Scattergl(trace.to_plotly_json(), skip_invalid=True) if trace.type == "scatter" else trace
+            for trace in fig.data
+        ]
+    return fig
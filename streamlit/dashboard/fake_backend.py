@@ -0,0 +1,265 @@
+# fake_backend.py
+# 네트워크/OAuth 없이 대시보드를 실행하고 측정하기 위한 프로세스 내 가짜 시트 백엔드
+#
+# 사용 예 (streamlit 폴더에서):
+#   python -m dashboard.fake_backend synthetic fixtures   # 합성 데이터 픽스처 생성
+#   python -m dashboard.fake_backend record fixtures      # 실제 시트를 픽스처로 저장
+#   DASHBOARD_SHEETS_BACKEND=fake DASHBOARD_FAKE_FIXTURES=fixtures streamlit run app2.py
+import argparse
+import datetime
+import json
+import os
+import random
+import re
+import threading
+import time
+from collections import deque
+
+from dashboard import sheets
+from dashboard.backend import BackendError, SheetsBackend
+from dashboard.sheet_loader import sheet_range
+
+
+def column_number(letters):
+    """A1 표기 열 이름 -> 1부터 세는 열 번호 (A -> 1, AA -> 27)"""
+    number = 0
+    for letter in letters:
+        number = number * 26 + ord(letter) - ord("A") + 1
+    return number
+
+
+def parse_a1(a1):
+    """
+    '시트'!A5:D / '시트'!1:1 / '시트' -> (워크시트 이름, 행 slice, 마지막 열 번호 또는 None).
+    시작 열은 항상 A 라고 본다.
+    """
+    name, _, cells = a1.partition("!")
+    name = name[1:-1].replace("''", "'") if name.startswith("'") else name
+    if not cells:
+        return name, slice(None), None
+    start, _, end = cells.partition(":")
+    start_row = int(re.sub(r"[A-Z]", "", start) or 1)
+    end_row = re.sub(r"[A-Z]", "", end)
+    end_column = re.sub(r"[0-9]", "", end)
+    return name, slice(start_row - 1, int(end_row) if end_row else None), column_number(end_column) or None
+
+
+def trim_row(row):
+    """실제 API처럼 행 끝의 빈 셀을 잘라낸다"""
+    row = list(row)
+    while row and row[-1] == "":
+        row.pop()
+    return row
+
+
+class FakeSheetsBackend(SheetsBackend):
+    """
+    spreadsheets = {스프레드시트 key: {워크시트 이름: [[셀 값, ...], ...]}}
+
+    latency / jitter: 요청마다 기다리는 시간(초)
+    quota_per_minute: 최근 60초 요청 수가 이 값을 넘으면 429 BackendError
+    failure_rate: 이 확률로 503 BackendError
+    호출된 요청은 self.requests 에 순서대로 기록된다.
+    """
+
+    def __init__(self, spreadsheets, modified_time="2025-01-01T00:00:00.000Z",
+                 latency=0.0, jitter=0.0, quota_per_minute=None, failure_rate=0.0, seed=None):
+        self.spreadsheets = spreadsheets
+        self.modified_times = {key: modified_time for key in spreadsheets}
+        self.latency = latency
+        self.jitter = jitter
+        self.quota_per_minute = quota_per_minute
+        self.failure_rate = failure_rate
+        self.requests = []
+        self.throttled = 0
+        self.failed = 0
+        self._recent = deque()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    # -----------------------------------------
+    # 픽스처 파일
+    # -----------------------------------------
+    @classmethod
+    def from_fixture_dir(cls, path, **options):
+        """path/<스프레드시트 key>.json 픽스처를 모두 읽는다"""
+        spreadsheets = {}
+        modified_times = {}
+        for file_name in sorted(os.listdir(path)):
+            if not file_name.endswith(".json"):
+                continue
+            with open(os.path.join(path, file_name), "r", encoding="utf-8") as f:
+                fixture = json.load(f)
+            spreadsheets[fixture["key"]] = fixture["worksheets"]
+            modified_times[fixture["key"]] = fixture["modifiedTime"]
+        backend = cls(spreadsheets, **options)
+        backend.modified_times.update(modified_times)
+        return backend
+
+    def update_worksheet(self, key, worksheet, values):
+        """워크시트 값을 바꾸고 리비전(modifiedTime)을 올린다"""
+        with self._lock:
+            self.spreadsheets[key][worksheet] = values
+            self.modified_times[key] = datetime.datetime.utcnow().isoformat() + "Z"
+
+    # -----------------------------------------
+    # 지연 / 호출 한도 / 실패 주입
+    # -----------------------------------------
+    def _request(self, entry):
+        with self._lock:
+            self.requests.append(entry)
+            now = time.monotonic()
+            if self.quota_per_minute is not None:
+                while self._recent and now - self._recent[0] > 60:
+                    self._recent.popleft()
+                if len(self._recent) >= self.quota_per_minute:
+                    self.throttled += 1
+                    raise BackendError(429, "Quota exceeded for quota metric 'Read requests'")
+                self._recent.append(now)
+            fail = self._random.random() < self.failure_rate
+            delay = self.latency + self._random.uniform(0, self.jitter)
+
+        if delay > 0:
+            time.sleep(delay)
+        if fail:
+            with self._lock:
+                self.failed += 1
+            raise BackendError(503, "The service is currently unavailable.")
+
+    def revision(self, key):
+        self._request(("revision", key))
+        return self.modified_times[key]
+
+    def batch_get(self, key, ranges):
+        ranges = list(ranges)
+        self._request(("batch_get", key, tuple(ranges)))
+        worksheets = self.spreadsheets[key]
+        result = []
+        for a1 in ranges:
+            name, rows, end_column = parse_a1(a1)
+            values = worksheets.get(name, [])
+            # 실제 시트처럼 격자(가장 긴 행 x 행 수) 밖을 가리키는 범위는 요청 전체를 거부
+            grid_columns = max((len(row) for row in values), default=0)
+            if (end_column is not None and end_column > grid_columns) or (rows.start or 0) >= max(len(values), 1):
+                raise BackendError(400, f"Range ({a1}) exceeds grid limits. Max rows: {len(values)}, max columns: {grid_columns}")
+            result.append([trim_row(row)[:end_column] for row in values[rows]])
+        return result
+
+
+#####################################
+# 픽스처 만들기 (합성 데이터 / 실제 시트 기록)
+#####################################
+def write_fixture_dir(path, spreadsheets, modified_times):
+    os.makedirs(path, exist_ok=True)
+    for key, worksheets in spreadsheets.items():
+        fixture = {"key": key, "modifiedTime": modified_times[key], "worksheets": worksheets}
+        with open(os.path.join(path, f"{key}.json"), "w", encoding="utf-8") as f:
+            json.dump(fixture, f, ensure_ascii=False)
+
+
+def record_spreadsheets(backend, spec=sheets.DASHBOARD_SHEETS):
+    """다른 백엔드(보통 GspreadBackend)에서 대시보드 시트를 그대로 받아온다"""
+    spreadsheets = {}
+    modified_times = {}
+    for key, worksheets in spec.items():
+        names = [name for name, _ in worksheets]
+        values = backend.batch_get(key, [sheet_range(name) for name in names])
+        spreadsheets[key] = dict(zip(names, values))
+        modified_times[key] = backend.revision(key)
+    return spreadsheets, modified_times
+
+
+SYNTHETIC_CATEGORIES = ["패션의류", "패션잡화", "화장품", "식품", "생활/건강", "출산/육아", "디지털/가전", "기타"]
+SYNTHETIC_STATUSES = ["방어중", "이전확정", "이전완료", "KPI제외", "", ""]
+
+
+def synthetic_spreadsheets(company_rows=5000, start_month="2022-01", seed=0):
+    """업체정보 / 매출 / 카테고리 시트와 같은 모양의 합성 데이터"""
+    rng = random.Random(seed)
+    months = []
+    month = datetime.date.fromisoformat(start_month + "-01")
+    today = datetime.date.today().replace(day=1)
+    while month < today:
+        months.append(month.strftime("%Y-%m"))
+        month = (month + datetime.timedelta(days=32)).replace(day=1)
+
+    # 업체정보: 1행 제목, 2행 헤더
+    first_day = datetime.date.fromisoformat(start_month + "-01")
+    span = (datetime.date.today() - first_day).days
+    company = [["[통합검색] 업체정보"], ["몰ID", "업체명", "타사이전(접수일)", "타사이전(현황)", "담당자", "비고", "비고"]]
+    for i in range(company_rows):
+        received = ""
+        if rng.random() < 0.3:
+            received = (first_day + datetime.timedelta(days=rng.randrange(span))).strftime("%y-%m-%d")
+        status = rng.choice(SYNTHETIC_STATUSES) if received else ""
+        company.append([f"mall{i:05d}", f"업체{i}", received, status, f"담당{i % 17}", "", ""])
+
+    # 매출 (원 단위)
+    sales = [["해당월", "VIP", "TOP100", "전체"]]
+    for i, month in enumerate(months):
+        vip = int(2.0e11 * (1 + 0.01 * i) * rng.uniform(0.9, 1.1))
+        top100 = int(3.5e11 * (1 + 0.01 * i) * rng.uniform(0.9, 1.1))
+        total = int(1.1e12 * (1 + 0.008 * i) * rng.uniform(0.9, 1.1))
+        sales.append([month, str(vip), str(top100), str(total)])
+
+    def category_sheet(scale):
+        rows = [["해당월"] + SYNTHETIC_CATEGORIES]
+        for i, month in enumerate(months):
+            rows.append([month] + [str(int(scale * (1 + 0.01 * i) * rng.uniform(0.5, 1.5))) for _ in SYNTHETIC_CATEGORIES])
+        return rows
+
+    category = [["몰ID", "몰명", "업종", "카테고리"]]
+    for i in range(200):
+        category.append([f"mall{i:05d}", f"업체{i}", "쇼핑몰", rng.choice(SYNTHETIC_CATEGORIES)])
+
+    return {
+        sheets.COMPANY_SHEET_KEY: {sheets.COMPANY_SHEET: company},
+        sheets.SALES_SHEET_KEY: {
+            sheets.SALES_SHEET: sales,
+            sheets.EC_CATEGORY_SHEET: category_sheet(1.2e11),
+            sheets.MALL_CATEGORY_SHEET: category_sheet(6.0e10),
+            sheets.CATEGORY_SHEET: category,
+        },
+    }
+
+
+def backend_from_env(environ=os.environ):
+    """
+    DASHBOARD_FAKE_FIXTURES: 픽스처 폴더 (없으면 합성 데이터)
+    DASHBOARD_FAKE_LATENCY / DASHBOARD_FAKE_JITTER: 요청 지연(초)
+    DASHBOARD_FAKE_QUOTA: 분당 요청 한도
+    DASHBOARD_FAKE_FAILURE_RATE: 실패 확률 (0~1)
+    """
+    quota = environ.get("DASHBOARD_FAKE_QUOTA")
+    options = {
+        "latency": float(environ.get("DASHBOARD_FAKE_LATENCY", 0)),
+        "jitter": float(environ.get("DASHBOARD_FAKE_JITTER", 0)),
+        "quota_per_minute": int(quota) if quota else None,
+        "failure_rate": float(environ.get("DASHBOARD_FAKE_FAILURE_RATE", 0)),
+    }
+    fixture_dir = environ.get("DASHBOARD_FAKE_FIXTURES")
+    if fixture_dir:
+        return FakeSheetsBackend.from_fixture_dir(fixture_dir, **options)
+    return FakeSheetsBackend(synthetic_spreadsheets(), **options)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="가짜 시트 백엔드용 픽스처 만들기")
+    parser.add_argument("mode", choices=["synthetic", "record"])
+    parser.add_argument("path")
+    parser.add_argument("--rows", type=int, default=5000, help="합성 업체정보 행 수")
+    args = parser.parse_args()
+
+    if args.mode == "synthetic":
+        data = synthetic_spreadsheets(company_rows=args.rows)
+        stamp = datetime.datetime.utcnow().isoformat() + "Z"
+        write_fixture_dir(args.path, data, {key: stamp for key in data})
+    else:
+        from dashboard.backend import GspreadBackend
+        from dashboard.sheet_client import SharedSheetsClient
+
+        shared = SharedSheetsClient()
+        data, revisions = record_spreadsheets(GspreadBackend(shared.client))
+        shared.close()
+        write_fixture_dir(args.path, data, revisions)
+    print(f"픽스처 저장: {args.path}")
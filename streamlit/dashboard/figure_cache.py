@@ -0,0 +1,72 @@
+# figure_cache.py
+# (차트 ID, 데이터 버전, 보기 조건) 별로 직렬화한 Plotly 그림을 보관하는 LRU 캐시
+import threading
+from collections import OrderedDict
+
+import plotly.io as pio
+
+
+class FigureCache:
+    """
+    그림은 Plotly JSON 문자열로 보관하고, 전체 크기가 max_bytes 를 넘으면 가장 오래 안 쓴 것부터 버린다.
+    프로세스 전체가 공유하므로 같은 조건의 차트는 여러 세션이 요청해도 한 번만 만든다.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._specs = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(chart_id, version, params=None):
+        """params(dict) 는 순서와 무관하게 같은 키가 되도록 정렬한다"""
+        items = tuple(sorted((params or {}).items()))
+        return chart_id, version, items
+
+    def get_or_build(self, chart_id, version, build, params=None):
+        """캐시에 있으면 JSON 에서 그림을 되살리고, 없으면 build() 로 만들어 저장한다"""
+        key = self.make_key(chart_id, version, params)
+        with self._lock:
+            entry = self._specs.get(key)
+            if entry is not None:
+                self._specs.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if entry is not None:
+            return pio.from_json(entry[0], skip_invalid=True)
+
+        fig = build()
+        self._store(key, fig.to_json())
+        return fig
+
+    def _store(self, key, spec):
+        size = len(spec.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._specs.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._specs[key] = (spec, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._specs.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def stats(self):
+        with self._lock:
+            requests = self.hits + self.misses
+            return {
+                "entries": len(self._specs),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / requests if requests else 0.0,
+                "evictions": self.evictions,
+            }
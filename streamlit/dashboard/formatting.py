@@ -0,0 +1,96 @@
+# formatting.py
+# 금액을 조/억 단위 문자열로 바꾸는 함수 (스칼라 / 배열 / 차트 축)
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+EOK = 100_000_000  # 1억 원
+JO_IN_EOK = 10_000  # 1조 = 10000억
+
+
+@lru_cache(maxsize=65536)
+def format_currency(amount):
+    """
+    금액을 조 단위 또는 억 단위로 표시 (음수는 절댓값을 표시하고 부호를 앞에 붙임)
+    예: 11219억 -> 1조 1,219억, -15000억 -> -1조 5,000억
+    """
+    if amount < 0:
+        return "-" + format_currency(-amount)
+    if amount >= JO_IN_EOK:  # 10000억 = 1조
+        jo = amount // JO_IN_EOK
+        eok = amount % JO_IN_EOK
+        if eok > 0:
+            return f"{jo}조 {eok:,}억"
+        else:
+            return f"{jo}조"
+    else:
+        return f"{amount:,}억"
+
+
+def format_won(values, na=""):
+    """
+    원 단위 금액 (스칼라, 배열, Series) -> 조/억 문자열. 억 미만은 버리고, 결측은 na.
+    배열은 서로 다른 억 값만 한 번씩 포맷한 뒤 되돌려 놓으므로 행이 많아도 반복 값은 다시 계산하지 않는다.
+    Series 를 넣으면 같은 인덱스의 Series 를 돌려준다.
+    """
+    if np.ndim(values) == 0:
+        return na if pd.isna(values) else format_currency(int(values / EOK))
+
+    array = np.asarray(values, dtype="float64")
+    missing = np.isnan(array)
+    eok = np.trunc(np.where(missing, 0, array) / EOK).astype("int64")
+    unique, inverse = np.unique(eok, return_inverse=True)
+    labels = np.array([format_currency(int(v)) for v in unique], dtype=object)
+    result = labels[inverse.reshape(eok.shape)]
+    result[missing] = na
+    if isinstance(values, pd.Series):
+        return pd.Series(result, index=values.index, name=values.name)
+    return result
+
+
+#####################################
+# Plotly 축 / 호버
+#####################################
+def currency_ticks(vmin, vmax, count=6):
+    """
+    원 단위 범위 [vmin, vmax] 에 1-2-5 간격의 눈금 위치와 조/억 라벨.
+    값이 하나뿐이거나 평평한 계열(vmin == vmax)은 그 값 둘레에 대칭 범위를 잡는다.
+    """
+    if not np.isfinite([vmin, vmax]).all() or vmax < vmin:
+        return [], []
+    if vmax == vmin:
+        pad = max(abs(vmin) * 0.1, EOK)
+        vmin, vmax = vmin - pad, vmax + pad
+    raw_step = (vmax - vmin) / max(count - 1, 1)
+    magnitude = 10 ** np.floor(np.log10(raw_step))
+    step = next(m * magnitude for m in (1, 2, 5, 10) if m * magnitude >= raw_step)
+    step = max(step, EOK)
+    ticks = np.arange(np.floor(vmin / step) * step, vmax + step, step)
+    return ticks.tolist(), format_won(ticks).tolist()
+
+
+def apply_currency_format(fig, axis="y", count=6):
+    """
+    원 단위 값으로 그린 Plotly 그림에 조/억 축 라벨과 호버를 붙인다.
+    데이터를 억 단위로 나눈 사본을 만들지 않고, 눈금은 tickvals/ticktext, 호버는 customdata 로 표시한다.
+    """
+    lows, highs = [], []
+    for trace in fig.data:
+        values = getattr(trace, axis)
+        if values is None or len(values) == 0:
+            continue
+        values = np.asarray(values, dtype="float64")
+        if np.isnan(values).all():
+            continue
+        lows.append(np.nanmin(values))
+        highs.append(np.nanmax(values))
+        trace.customdata = format_won(values)
+        other = "x" if axis == "y" else "y"
+        trace.hovertemplate = f"%{{{other}}}<br>%{{fullData.name}}: %{{customdata}}<extra></extra>"
+
+    tickvals, ticktext = currency_ticks(min(lows), max(highs), count) if lows else ([], [])
+    # 눈금을 못 만들면 Plotly 기본 눈금을 그대로 둔다 (빈 tickvals 는 축 라벨을 모두 지움)
+    if tickvals:
+        fig.update_layout({f"{axis}axis": dict(tickmode="array", tickvals=tickvals, ticktext=ticktext)})
+    return fig
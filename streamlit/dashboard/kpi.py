@@ -0,0 +1,107 @@
+# kpi.py
+# 매출 / 카테고리 시트의 월별 전월(MoM) / 전년 동월(YoY) 증감 표를 한 번에 계산
+import numpy as np
+import pandas as pd
+
+from dashboard.schema import month_period
+
+MONTH_COL = "해당월"
+
+# 관리몰 전체 = VIP + TOP100 (시트에는 없는 파생 지표)
+DERIVED_METRICS = {"관리몰": ("VIP", "TOP100")}
+
+# 지표별 항목 순서
+DELTA_FIELDS = ["value", "mom", "mom_pct", "yoy", "yoy_pct"]
+
+# 카테고리 시트의 카테고리 합계 컬럼 이름
+CATEGORY_TOTAL = "합계"
+
+
+def monthly_values(df, columns, month_col=MONTH_COL):
+    """
+    월 PeriodIndex 위의 float 값 표 (형식이 틀린 월은 버리고, 같은 월은 마지막 행 사용)
+    수집 시점에 월 인덱스가 붙은 시트는 그 인덱스를 그대로 쓰고, 아니면 month_col 을 파싱한다.
+    """
+    months = df.index if isinstance(df.index, pd.PeriodIndex) else month_period(df[month_col])
+    valid = ~months.isna()
+    values = pd.DataFrame(
+        {col: df[col].to_numpy(dtype="float64")[valid] for col in columns},
+        index=months[valid],
+    )
+    return values[~values.index.duplicated(keep="last")].sort_index()
+
+
+def delta_table(values):
+    """
+    월 PeriodIndex 값 표 -> (지표, 항목) MultiIndex 컬럼의 증감 표. 항목은 DELTA_FIELDS.
+    비교 월은 행 위치가 아니라 달력 기준(1개월 전 / 12개월 전)이라 중간에 빠진 월이 있어도 어긋나지 않고,
+    비교 월이 없으면 증감은 NaN 이다.
+    """
+    columns = pd.MultiIndex.from_product([values.columns, DELTA_FIELDS])
+    if values.empty:
+        return pd.DataFrame(columns=columns)
+
+    # 빈 월을 채운 달력에서 한 칸 / 열두 칸 밀면 전월 / 전년 동월
+    calendar = pd.period_range(values.index.min(), values.index.max(), freq="M")
+    full = values.reindex(calendar)
+    current = full.to_numpy()
+    parts = {"value": full}
+    for label, periods in (("mom", 1), ("yoy", 12)):
+        base = full.shift(periods).to_numpy()
+        delta = current - base
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pct = np.where(base != 0, delta / base * 100, np.nan)
+        parts[label] = pd.DataFrame(delta, index=calendar, columns=full.columns)
+        parts[f"{label}_pct"] = pd.DataFrame(pct, index=calendar, columns=full.columns)
+
+    table = pd.concat(parts, axis=1).swaplevel(axis=1)[columns]
+    return table.loc[values.index]
+
+
+def kpi_table(df, metrics=None, month_col=MONTH_COL):
+    """매출 시트의 수치 컬럼(+ 관리몰 합계)에 대한 월별 증감 표"""
+    if metrics is None:
+        metrics = [col for col in df.columns if col != month_col and pd.api.types.is_numeric_dtype(df[col])]
+    values = monthly_values(df, metrics, month_col)
+    for name, parts in DERIVED_METRICS.items():
+        if all(part in values.columns for part in parts):
+            values[name] = values[list(parts)].sum(axis=1, min_count=len(parts))
+    return delta_table(values)
+
+
+def category_table(df, month_col=None):
+    """
+    카테고리 시트(첫 열 해당월, 나머지 카테고리별 금액)의 월별 증감 표.
+    카테고리마다 DELTA_FIELDS 에 share(그 달 합계 대비 비중 %) 항목이 더해지고,
+    CATEGORY_TOTAL 지표는 카테고리 합계의 증감이다.
+    """
+    month_col = month_col or df.columns[0]
+    categories = [col for col in df.columns if col != month_col]
+    values = monthly_values(df, categories, month_col)
+    values[CATEGORY_TOTAL] = values[categories].sum(axis=1, min_count=1)
+
+    table = delta_table(values)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        share = values[categories].div(values[CATEGORY_TOTAL].where(values[CATEGORY_TOTAL] != 0), axis=0) * 100
+    share.columns = pd.MultiIndex.from_product([categories, ["share"]])
+    order = [(col, field) for col in values.columns for field in DELTA_FIELDS + ["share"] if col in categories or field != "share"]
+    return pd.concat([table, share], axis=1)[order]
+
+
+def aligned_table(*frames):
+    """
+    (DataFrame, 컬럼 목록) 여러 개를 월 인덱스 하나로 맞춘 넓은 표 (outer join, 월 오름차순)
+    DataFrame 이 None 이면 건너뛴다. 컬럼 이름이 겹치면 뒤에 오는 표의 컬럼이 이긴다.
+    """
+    parts = [monthly_values(df, columns) for df, columns in frames if df is not None]
+    if not parts:
+        return pd.DataFrame(index=pd.PeriodIndex([], freq="M"))
+    table = pd.concat(parts, axis=1, join="outer").sort_index()
+    return table.loc[:, ~table.columns.duplicated(keep="last")]
+
+
+def latest(table):
+    """가장 최근 월과 그 월의 KPI 행 (표가 비어 있으면 None, None)"""
+    if table.empty:
+        return None, None
+    return table.index[-1], table.iloc[-1]
@@ -0,0 +1,158 @@
+# perf_trace.py
+# rerun 한 번의 구간별 소요 시간을 재고, JSON lines 파일에 기록하는 계측 도구
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+import pandas as pd
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+
+class RerunTrace:
+    """
+    with trace.span("이름"): ... 로 구간을 잰다. 중첩된 구간은 depth 가 1씩 늘어난다.
+    """
+
+    def __init__(self, session_id, rerun_id, seq, kind="rerun"):
+        self.session_id = session_id
+        self.rerun_id = rerun_id
+        self.seq = seq
+        self.kind = kind
+        self.started_at = time.time()
+        self._start = time.perf_counter()
+        self._depth = 0
+        self.spans = []
+        self.total = None
+
+    @contextmanager
+    def span(self, name):
+        entry = {"name": name, "depth": self._depth, "start": time.perf_counter() - self._start}
+        self.spans.append(entry)
+        self._depth += 1
+        try:
+            yield entry
+        finally:
+            self._depth -= 1
+            entry["seconds"] = time.perf_counter() - self._start - entry["start"]
+
+    def finish(self):
+        self.total = time.perf_counter() - self._start
+        return self
+
+    def to_record(self):
+        return {
+            "kind": self.kind,
+            "session_id": self.session_id,
+            "rerun_id": self.rerun_id,
+            "seq": self.seq,
+            "started_at": self.started_at,
+            "total": self.total,
+            "spans": self.spans,
+        }
+
+    def to_frame(self):
+        rows = [
+            {"구간": "  " * s["depth"] + s["name"], "ms": round(s.get("seconds", 0) * 1000, 1)}
+            for s in self.spans
+        ]
+        rows.append({"구간": "전체", "ms": round((self.total or 0) * 1000, 1)})
+        return pd.DataFrame(rows)
+
+
+class TraceWriter:
+    """
+    여러 세션이 공유하는 JSON lines 기록기.
+    path 가 None 이면 기록하지 않는다. 파일이 max_bytes 를 넘으면 path + ".1" 로 옮기고 새로 쓴다 (직전 파일 하나만 보관).
+    기록 실패(읽기 전용 폴더 등)는 한 번만 알리고 무시해 rerun / 데이터 갱신을 막지 않는다.
+    """
+
+    def __init__(self, path, max_bytes=50 * 1024 * 1024):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.failed = False
+        self._lock = threading.Lock()
+
+    def write(self, record):
+        if not self.path:
+            return
+        line = json.dumps(record, ensure_ascii=False)
+        with self._lock:
+            try:
+                if self.max_bytes and os.path.exists(self.path) and os.path.getsize(self.path) > self.max_bytes:
+                    os.replace(self.path, self.path + ".1")
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+            except OSError as e:
+                if not self.failed:
+                    print(f"성능 기록 파일 쓰기 오류 ({self.path}): {e}")
+                self.failed = True
+
+    def write_load(self, result):
+        """백그라운드 시트 로드 결과(sheet_loader.LoadResult)를 refresh 레코드로 기록"""
+        spans = []
+        for name, t in result.timings.items():
+            spans.append({"name": f"fetch:{name}", "depth": 0, "source": t.source, "seconds": t.fetch})
+            spans.append({"name": f"parse:{name}", "depth": 0, "seconds": t.parse})
+        self.write({
+            "kind": "refresh",
+            "started_at": time.time() - result.elapsed,
+            "total": result.elapsed,
+            "errors": dict(result.errors),
+            "spans": spans,
+        })
+
+
+#####################################
+# Streamlit 세션 연동
+#####################################
+def start_rerun(kind="rerun"):
+    """스크립트 맨 위에서 호출: 세션 ID 와 rerun ID 가 붙은 RerunTrace 를 만든다"""
+    ctx = get_script_run_ctx()
+    session_id = ctx.session_id if ctx is not None else "bare"
+    seq = st.session_state.get("_perf_trace_seq", 0) + 1
+    st.session_state["_perf_trace_seq"] = seq
+    return RerunTrace(session_id, uuid.uuid4().hex[:12], seq, kind)
+
+
+def is_fragment_rerun():
+    """지금 실행이 st.fragment 하나만 다시 도는 부분 rerun 인지"""
+    ctx = get_script_run_ctx()
+    return bool(ctx is not None and ctx.fragment_ids_this_run)
+
+
+@contextmanager
+def fragment_span(name, parent, writer):
+    """
+    st.fragment 본문을 감싼다. 전체 rerun 안에서는 parent 의 구간 하나로 재고,
+    fragment 만 다시 도는 부분 rerun 이면 kind="fragment" 레코드를 따로 기록한다 (전체 rerun 과 소요 시간 비교용).
+    본문 안의 하위 구간은 yield 된 trace 로 잰다.
+    """
+    if not is_fragment_rerun():
+        with parent.span(name):
+            yield parent
+        return
+
+    trace = start_rerun(kind="fragment")
+    try:
+        with trace.span(name):
+            yield trace
+    finally:
+        trace.finish()
+        writer.write(trace.to_record())
+        # 사이드바는 fragment 밖이라 갱신되지 않으므로 fragment 안에 표시
+        if st.session_state.get("show_perf_panel"):
+            st.caption(f"부분 rerun #{trace.seq}: {trace.total * 1000:.0f}ms ({name})")
+
+
+def finish_rerun(trace, writer, show_panel=False):
+    """스크립트 맨 끝에서 호출: 기록하고, show_panel 이면 사이드바에 구간표를 보여준다"""
+    trace.finish()
+    writer.write(trace.to_record())
+    if show_panel:
+        with st.sidebar.expander(f"성능 (rerun #{trace.seq}, {trace.total * 1000:.0f}ms)", expanded=True):
+            st.dataframe(trace.to_frame(), hide_index=True, use_container_width=True)
+            st.caption(f"session {trace.session_id[:8]} · rerun {trace.rerun_id}")
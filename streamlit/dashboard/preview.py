@@ -0,0 +1,88 @@
+# preview.py
+# 큰 시트 미리보기용 서버 측 페이지 처리: 정렬 / 검색 / 페이지 자르기를 캐시된 DataFrame 에서 하고, 보이는 행만 내보낸다
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+PAGE_SIZE = 50
+
+
+class FramePager:
+    """
+    데이터 버전마다 한 번 만드는 미리보기 색인 (frame 은 수정하지 않는다).
+    - 컬럼별 정렬 순서(행 위치 배열)는 처음 요청될 때 한 번만 계산해 둔다.
+    - (행 범위, 정렬, 검색) 조합의 결과 위치 배열은 LRU 로 max_views 개까지 보관한다.
+    페이지를 넘길 때는 위치 배열에서 page_size 개를 잘라 iloc 한 번만 하므로, 시트가 커져도 전송 / 표시 비용은 한 페이지 분량이다.
+    """
+
+    def __init__(self, frame, max_views=32):
+        self.frame = frame
+        self.columns = list(frame.columns)
+        self.max_views = max_views
+        self._orders = {}
+        self._views = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _order(self, column, ascending):
+        """column 기준 전체 행 정렬 순서 (결측은 항상 맨 뒤, 같은 값은 원래 순서 유지)"""
+        key = (column, ascending)
+        order = self._orders.get(key)
+        if order is None:
+            values = self.frame[column].reset_index(drop=True)
+            try:
+                ordered = values.sort_values(ascending=ascending, kind="stable", na_position="last")
+            except TypeError:
+                # 숫자 / 문자열이 섞인 object 컬럼은 문자열로 비교
+                ordered = values.astype(str).where(values.notna()).sort_values(
+                    ascending=ascending, kind="stable", na_position="last")
+            order = ordered.index.to_numpy()
+            self._orders[key] = order
+        return order
+
+    def _matches(self, rows, column, text):
+        """rows(위치 배열) 중 column 값에 text 가 들어 있는 행 (대소문자 무시)"""
+        values = self.frame[column].iloc[rows]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            # category 는 범주 값만 한 번 검사
+            hit = values.cat.categories.astype(str).str.contains(text, case=False, regex=False)
+            codes = values.cat.codes.to_numpy()
+            return np.where(codes >= 0, np.asarray(hit)[codes], False)
+        return values.astype(str).str.contains(text, case=False, regex=False).to_numpy()
+
+    def positions(self, rows=slice(None), sort=None, ascending=True, filter_column=None, filter_text=""):
+        """
+        rows(slice) 범위에서 검색 조건에 맞는 행을 정렬한 위치 배열.
+        sort 가 None 이면 frame 순서 그대로.
+        """
+        start, stop, _ = rows.indices(len(self.frame))
+        filter_text = (filter_text or "").strip()
+        key = (start, stop, sort, ascending, filter_column if filter_text else None, filter_text)
+        with self._lock:
+            result = self._views.get(key)
+            if result is not None:
+                self._views.move_to_end(key)
+                return result
+
+            if sort is None:
+                result = np.arange(start, stop)
+            else:
+                order = self._order(sort, ascending)
+                result = order[(order >= start) & (order < stop)]
+            if filter_text and filter_column is not None:
+                result = result[self._matches(result, filter_column, filter_text)]
+
+            self._views[key] = result
+            while len(self._views) > self.max_views:
+                self._views.popitem(last=False)
+            return result
+
+    def page(self, positions, page, page_size=PAGE_SIZE):
+        """positions 의 page 번째(0부터) 페이지 행"""
+        start = page * page_size
+        return self.frame.iloc[positions[start:start + page_size]]
+
+
+def page_count(total, page_size=PAGE_SIZE):
+    return max(1, -(-total // page_size))
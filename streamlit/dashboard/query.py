@@ -0,0 +1,70 @@
+# query.py
+# 데이터 버전별 in-process DuckDB: 캐시된 시트 DataFrame 을 테이블로 등록하고, 매개변수 SQL 결과를 캐시
+import threading
+from collections import OrderedDict
+
+import duckdb
+import pandas as pd
+
+from dashboard.schema import MONTH_INDEX
+
+
+def _sql_frame(df):
+    """월 PeriodIndex 가 붙은 표는 MONTH_INDEX 날짜 컬럼으로 꺼내서 등록 (나머지 표는 그대로)"""
+    if isinstance(df.index, pd.PeriodIndex):
+        return df.set_axis(df.index.to_timestamp(), axis=0).rename_axis(MONTH_INDEX).reset_index()
+    return df
+
+
+class VersionDatabase:
+    """
+    한 데이터 버전의 DataFrame 들을 등록한 DuckDB 연결.
+    표는 복사하지 않고 view 로 등록하며 (질의할 때 DuckDB 가 여러 스레드로 스캔),
+    같은 (SQL, 매개변수) 결과는 LRU 로 max_results 개까지 보관한다.
+    돌려준 DataFrame 은 여러 세션이 공유하므로 수정하지 않는다.
+    """
+
+    def __init__(self, tables, threads=None, memory_limit=None, temp_directory=None, max_results=128):
+        config = {}
+        if threads:
+            config["threads"] = threads
+        if memory_limit:
+            config["memory_limit"] = memory_limit
+        if temp_directory:
+            # memory_limit 를 넘는 집계 / 정렬은 이 디렉터리로 내려 쓰며 처리 (out-of-core)
+            config["temp_directory"] = temp_directory
+        self._con = duckdb.connect(config=config)
+        self.tables = []
+        for name, df in tables.items():
+            if df is not None:
+                self._con.register(name, _sql_frame(df))
+                self.tables.append(name)
+
+        self.max_results = max_results
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def query(self, sql, params=None):
+        """? 자리표시자 SQL 실행 결과 (DataFrame). params 의 리스트는 DuckDB LIST 로 전달된다."""
+        params = list(params or [])
+        key = (sql, repr(params))
+        with self._lock:
+            result = self._results.get(key)
+            if result is not None:
+                self._results.move_to_end(key)
+                self.hits += 1
+                return result
+
+            # 연결 하나를 여러 세션이 쓰므로 실행도 lock 안에서 (질의 자체는 DuckDB 가 병렬 처리)
+            self.misses += 1
+            result = self._con.execute(sql, params).df()
+            self._results[key] = result
+            while len(self._results) > self.max_results:
+                self._results.popitem(last=False)
+            return result
+
+    def stats(self):
+        with self._lock:
+            return {"tables": list(self.tables), "results": len(self._results), "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,81 @@
+# schema.py
+# 시트별 컬럼 타입 정의와, 수집 시점에 한 번만 적용하는 타입 변환
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+STRING_DTYPE = "string[pyarrow]"
+
+# 월 단위 시트가 공유하는 행 인덱스 이름 (PeriodIndex, freq="M")
+MONTH_INDEX = "월"
+
+
+@dataclass(frozen=True)
+class SheetSchema:
+    """
+    numeric: 수치(금액) 컬럼 -> 결측이 없고 모두 정수면 int64, 아니면 float64
+    numeric_after_first: True 면 첫 번째 열을 제외한 모든 열을 수치 컬럼으로 취급
+    dates: {원본 컬럼: (새 컬럼, 날짜 형식)} -> 원본은 문자열로 두고 datetime64 컬럼 추가
+    categorical: 반복되는 값이 많은 컬럼 -> category
+    month: 'YYYY-MM' 문자열 컬럼 -> 행 인덱스를 월 PeriodIndex(MONTH_INDEX)로 바꾼다 (컬럼은 그대로 둠)
+    month_first: True 면 첫 번째 열을 month 컬럼으로 취급
+    나머지 컬럼은 모두 Arrow 문자열
+    """
+    numeric: tuple = ()
+    numeric_after_first: bool = False
+    dates: dict = field(default_factory=dict)
+    categorical: tuple = ()
+    month: str = None
+    month_first: bool = False
+
+
+def month_period(values):
+    """'2025-02' 같은 해당월 문자열 -> 월 PeriodIndex (형식이 틀린 값은 NaT)"""
+    dates = pd.to_datetime(pd.Series(values, dtype=object), format="%Y-%m", errors="coerce")
+    return pd.PeriodIndex(dates, freq="M", name=MONTH_INDEX)
+
+
+def _numeric_dtype(values):
+    """결측이 없고 모두 정수 값이면 int64 로 줄인다"""
+    if not np.isnan(values).any() and np.array_equal(values, np.floor(values)):
+        return values.astype("int64")
+    return values
+
+
+def apply_schema(df, schema):
+    """문자열 그대로인 시트 DataFrame 에 schema 를 적용한 새 DataFrame 을 반환한다"""
+    if schema.numeric_after_first:
+        numeric_cols = list(df.columns[1:])
+    else:
+        numeric_cols = [col for col in schema.numeric if col in df.columns]
+    categorical_cols = [col for col in schema.categorical if col in df.columns]
+
+    columns = {}
+
+    # 수치 컬럼은 2차원 값 배열을 한 번에 변환
+    if numeric_cols:
+        block = df[numeric_cols].to_numpy(dtype=object)
+        converted = pd.to_numeric(block.ravel(), errors="coerce").astype("float64")
+        converted = converted.reshape(block.shape)
+        for i, col in enumerate(numeric_cols):
+            columns[col] = _numeric_dtype(converted[:, i])
+
+    for col in categorical_cols:
+        columns[col] = df[col].astype("category")
+
+    for col in df.columns:
+        if col not in columns:
+            columns[col] = df[col].astype(STRING_DTYPE)
+
+    result = pd.DataFrame(columns, index=df.index)[list(df.columns)]
+
+    for col, (new_col, date_format) in schema.dates.items():
+        if col in df.columns:
+            result[new_col] = pd.to_datetime(df[col], format=date_format, errors="coerce")
+
+    # 월 단위 시트는 모두 같은 월 인덱스 위에 올려 두어, 시트 간 정렬이 인덱스 join 한 번이 되게 한다
+    month_col = df.columns[0] if schema.month_first and len(df.columns) else schema.month
+    if month_col in df.columns:
+        result.index = month_period(df[month_col])
+    return result
@@ -0,0 +1,101 @@
+# sheet_client.py
+# 프로세스 전체에서 공유하는 gspread 클라이언트 (토큰은 백그라운드에서 미리 갱신)
+import datetime
+import os
+import pickle
+import threading
+
+import gspread
+from google_auth_oauthlib.flow import InstalledAppFlow
+from google.auth.transport.requests import Request
+
+# OAuth 범위 지정
+SCOPES = [
+    "https://www.googleapis.com/auth/spreadsheets",
+    "https://www.googleapis.com/auth/drive"
+]
+
+
+class SharedSheetsClient:
+    """
+    token.pickle 을 한 번만 읽어 gspread 클라이언트를 만들고,
+    토큰 만료 refresh_margin 초 전에 타이머 스레드에서 갱신한다.
+    페이지 코드는 .client 만 사용하므로 rerun 중에 OAuth 갱신을 기다리지 않는다.
+
+    로더 스레드들은 별도 잠금 없이 같은 creds 를 쓴다. 요청마다 google-auth 세션이 토큰을 헤더에 넣고,
+    만료됐으면 그 자리에서 갱신한다 (동시에 갱신돼도 토큰 요청이 한 번 더 갈 뿐 결과는 같다).
+    타이머는 한 번에 하나만 예약되므로 갱신 / token.pickle 저장이 겹치지 않는다.
+    """
+
+    def __init__(self, token_path="token.pickle", secrets_path="credentials.json",
+                 scopes=SCOPES, refresh_margin=300, retry_delay=60, request_timeout=20):
+        self.token_path = token_path
+        self.secrets_path = secrets_path
+        self.scopes = scopes
+        self.refresh_margin = refresh_margin
+        self.retry_delay = retry_delay
+        self._timer = None
+
+        self.creds = self._load_credentials()
+        self.client = gspread.authorize(self.creds)
+        # HTTP 요청 하나당 제한 시간 (응답 없는 요청이 로더 스레드를 붙잡지 않도록)
+        self.client.set_timeout(request_timeout)
+        self._schedule_refresh()
+
+    # -----------------------------------------
+    # 인증 정보 로드 / 저장
+    # -----------------------------------------
+    def _load_credentials(self):
+        creds = None
+
+        # 기존에 토큰이 있다면 불러와 재사용
+        if os.path.exists(self.token_path):
+            with open(self.token_path, "rb") as token:
+                creds = pickle.load(token)
+
+        # 만료됐거나 없으면 새로 로그인
+        if not creds or not creds.valid:
+            if creds and creds.expired and creds.refresh_token:
+                # 토큰이 만료됐지만 refresh_token이 있을 때
+                creds.refresh(Request())
+            else:
+                # 처음 인증할 때
+                flow = InstalledAppFlow.from_client_secrets_file(self.secrets_path, self.scopes)
+                creds = flow.run_local_server(port=0)
+            self._save_credentials(creds)
+        return creds
+
+    def _save_credentials(self, creds):
+        tmp_path = self.token_path + ".tmp"
+        with open(tmp_path, "wb") as token:
+            pickle.dump(creds, token)
+        os.replace(tmp_path, self.token_path)
+
+    # -----------------------------------------
+    # 백그라운드 토큰 갱신
+    # -----------------------------------------
+    def _schedule_refresh(self, delay=None):
+        if delay is None:
+            expiry = self.creds.expiry  # google-auth 는 naive UTC datetime 사용
+            if expiry is None:
+                return
+            remaining = (expiry - datetime.datetime.utcnow()).total_seconds()
+            delay = max(remaining - self.refresh_margin, 0)
+
+        self._timer = threading.Timer(delay, self._refresh)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _refresh(self):
+        try:
+            self.creds.refresh(Request())
+            self._save_credentials(self.creds)
+        except Exception as e:
+            print(f"토큰 갱신 오류: {e}")
+            self._schedule_refresh(self.retry_delay)
+            return
+        self._schedule_refresh()
+
+    def close(self):
+        if self._timer is not None:
+            self._timer.cancel()
@@ -0,0 +1,283 @@
+# sheet_loader.py
+# 대시보드 시트 로드 단계: 스프레드시트별 batchGet 을 작은 스레드 풀에서 동시에 실행
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+
+import pandas as pd
+
+from dashboard.sheets import APPEND_ONLY_SHEETS, DASHBOARD_SHEETS
+
+# append-only 시트도 이 주기(초)마다 한 번은 전체를 다시 받아 앞쪽 행 수정 여부를 반영
+FULL_SYNC_INTERVAL = 24 * 60 * 60
+
+
+@dataclass
+class SheetTiming:
+    """워크시트 하나의 로드 시간 (초)"""
+    source: str             # "snapshot", "network" 또는 "incremental"
+    fetch: float = 0.0      # 리비전 확인 + 스냅샷 읽기 또는 batchGet
+    parse: float = 0.0
+
+    @property
+    def total(self):
+        return self.fetch + self.parse
+
+
+@dataclass
+class LoadResult:
+    """load_dashboard_sheets() 결과: 워크시트 이름 -> DataFrame(또는 None)"""
+    frames: dict = field(default_factory=dict)
+    timings: dict = field(default_factory=dict)
+    errors: dict = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    def summary(self):
+        lines = [f"시트 로드 {self.elapsed:.2f}s"]
+        for name, t in self.timings.items():
+            df = self.frames.get(name)
+            shape = f" {len(df)}행 {len(df.columns)}열" if df is not None else ""
+            lines.append(f"  {name}: {t.source}{shape} fetch={t.fetch:.3f}s parse={t.parse:.3f}s")
+        for name, message in self.errors.items():
+            lines.append(f"  {name}: 오류 {message}")
+        return "\n".join(lines)
+
+
+#####################################
+# values:batchGet 일괄 조회
+#####################################
+def sheet_range(worksheet):
+    """워크시트 전체를 가리키는 A1 범위 (이름에 [ ] 등이 있으므로 따옴표 처리)"""
+    return "'{}'".format(worksheet.replace("'", "''"))
+
+
+def batch_fetch(backend, key, worksheets):
+    """여러 워크시트 전체 값을 batchGet 한 번으로 가져온다 -> {워크시트 이름: 값}"""
+    values = backend.batch_get(key, [sheet_range(name) for name in worksheets])
+    return dict(zip(worksheets, values))
+
+
+#####################################
+# append-only 시트 증분 동기화
+#####################################
+def row_hash(row):
+    """행 끝의 빈 셀을 무시한 행 내용 해시"""
+    row = list(row)
+    while row and row[-1] == "":
+        row.pop()
+    return hashlib.sha1("\x1f".join(row).encode("utf-8")).hexdigest()
+
+
+# 증분 동기화 메타데이터 키 (스냅샷 메타데이터의 revision / rows 등은 저장할 때 정해지므로 여기에 넣지 않음)
+SYNC_KEYS = ("row_count", "columns", "header_hash", "tail_hash", "full_synced_at")
+
+
+def sync_meta(values):
+    """증분 동기화 기준: 데이터 행 수, 헤더 열 수, 헤더 해시, 마지막 행 해시 (1행이 헤더, 헤더 너비까지만 비교)"""
+    columns = len(values[0])
+    return {
+        "row_count": len(values) - 1,
+        "columns": columns,
+        "header_hash": row_hash(values[0]),
+        "tail_hash": row_hash(values[-1][:columns]),
+        "full_synced_at": time.time(),
+    }
+
+
+def full_sync_due(meta):
+    """append-only 스냅샷을 전체 다시 받아야 하는지 (증분 기준이 없거나 마지막 전체 동기화가 FULL_SYNC_INTERVAL 보다 오래됨)"""
+    return any(name not in meta for name in SYNC_KEYS) or time.time() - meta.get("full_synced_at", 0) > FULL_SYNC_INTERVAL
+
+
+def column_letter(number):
+    """1부터 세는 열 번호 -> A1 표기 열 이름 (1 -> A, 27 -> AA)"""
+    letters = ""
+    while number > 0:
+        number, rest = divmod(number - 1, 26)
+        letters = chr(ord("A") + rest) + letters
+    return letters
+
+
+def incremental_ranges(worksheet, row_count, columns):
+    """
+    헤더 행과, 마지막으로 동기화한 행(겹침 확인용)부터 끝까지의 범위.
+    열은 저장된 헤더의 마지막 열까지만 요청한다 (시트 격자보다 넓은 범위는 batchGet 전체가 거부됨).
+    헤더 행은 열 수가 바뀐 것도 알아채도록 행 전체를 받는다.
+    """
+    # 1행이 헤더이므로 마지막으로 동기화한 데이터 행은 시트의 row_count + 1 행
+    return [
+        f"{sheet_range(worksheet)}!1:1",
+        f"{sheet_range(worksheet)}!A{row_count + 1}:{column_letter(columns)}",
+    ]
+
+
+def append_rows(previous, header_values, tail_values, parse):
+    """
+    저장된 스냅샷 뒤에 새 행만 파싱해 붙인다. 반환값 (DataFrame, 메타데이터).
+    헤더나 겹치는 마지막 행이 바뀌었으면 (None, None) -> 전체 다시 불러오기.
+    """
+    df_old, meta = previous
+    if not header_values or row_hash(header_values[0]) != meta["header_hash"]:
+        return None, None
+    if not tail_values or row_hash(tail_values[0]) != meta["tail_hash"]:
+        return None, None
+
+    header = header_values[0]
+    new_rows = tail_values[1:]
+    if not new_rows:
+        return df_old, {name: meta[name] for name in SYNC_KEYS}
+
+    width = len(header)
+    new_rows = [(row + [""] * width)[:width] for row in new_rows]
+    df_new = parse([header] + new_rows)
+    # 월 인덱스 시트는 인덱스를 그대로 이어 붙이고, 그 밖에는 행 번호를 다시 매긴다
+    df = pd.concat([df_old, df_new], ignore_index=not isinstance(df_new.index, pd.PeriodIndex))
+    return df, {
+        "row_count": meta["row_count"] + len(new_rows),
+        "columns": meta["columns"],
+        "header_hash": meta["header_hash"],
+        "tail_hash": row_hash(new_rows[-1]),
+        "full_synced_at": meta["full_synced_at"],
+    }
+
+
+#####################################
+# 스프레드시트 단위 로드
+#####################################
+def fetch_worksheets(backend, store, key, revision, worksheets):
+    """
+    batchGet 한 번으로 받은 값을 파싱해 스냅샷으로 저장한다. (frames, timings) 반환
+    append-only 시트는 이전 스냅샷 이후의 행만 받아 붙이고,
+    헤더나 겹치는 마지막 행이 바뀌었으면 그 시트만 전체를 다시 받는다.
+    (그 밖의 앞쪽 행 수정은 FULL_SYNC_INTERVAL 마다의 전체 동기화에서 반영)
+    """
+    frames = {}
+    timings = {}
+
+    plans = []
+    ranges = []
+    for name, parse in worksheets:
+        previous = None
+        if name in APPEND_ONLY_SHEETS:
+            previous = store.load_latest(key, name)
+            if previous is not None and full_sync_due(previous[1]):
+                previous = None
+        if previous is not None:
+            ranges.extend(incremental_ranges(name, previous[1]["row_count"], previous[1]["columns"]))
+        else:
+            ranges.append(sheet_range(name))
+        plans.append((name, parse, previous))
+
+    start = time.perf_counter()
+    results = iter(backend.batch_get(key, ranges))
+    fetch_seconds = time.perf_counter() - start
+
+    full_reload = []
+    for name, parse, previous in plans:
+        start = time.perf_counter()
+        if previous is None:
+            values = next(results, [])
+            df = parse(values)
+            extra = sync_meta(values) if df is not None and name in APPEND_ONLY_SHEETS else None
+            source = "network"
+        else:
+            header_values, tail_values = next(results, []), next(results, [])
+            df, extra = append_rows(previous, header_values, tail_values, parse)
+            if df is None:
+                full_reload.append((name, parse))
+                continue
+            source = "incremental"
+
+        if df is not None:
+            store.save(key, name, revision, df, extra)
+        frames[name] = df
+        timings[name] = SheetTiming(source, fetch_seconds, time.perf_counter() - start)
+
+    if full_reload:
+        start = time.perf_counter()
+        values_by_name = batch_fetch(backend, key, [name for name, _ in full_reload])
+        reload_seconds = time.perf_counter() - start
+        for name, parse in full_reload:
+            start = time.perf_counter()
+            values = values_by_name.get(name, [])
+            df = parse(values)
+            if df is not None:
+                store.save(key, name, revision, df, sync_meta(values))
+            frames[name] = df
+            timings[name] = SheetTiming("network", fetch_seconds + reload_seconds, time.perf_counter() - start)
+    return frames, timings
+
+
+def load_spreadsheet(backend, store, key, worksheets):
+    """
+    Drive 리비전을 확인하고, 로컬 스냅샷이 없는 워크시트만 모아 batchGet 한 번으로 받아온다.
+    append-only 시트는 리비전이 같아도 마지막 전체 동기화가 FULL_SYNC_INTERVAL 보다 오래됐으면 다시 받는다.
+    (frames, timings) 를 반환한다.
+    """
+    frames = {}
+    timings = {}
+
+    start = time.perf_counter()
+    revision = store.revision(backend, key)
+    revision_seconds = time.perf_counter() - start
+
+    missing = []
+    for name, parse in worksheets:
+        start = time.perf_counter()
+        df = store.load(key, name, revision)
+        if df is not None and name in APPEND_ONLY_SHEETS and full_sync_due(store.read_meta(key, name) or {}):
+            df = None
+        if df is None:
+            missing.append((name, parse))
+        else:
+            frames[name] = df
+            timings[name] = SheetTiming("snapshot", revision_seconds + time.perf_counter() - start)
+
+    if not missing:
+        return frames, timings
+
+    fetched, fetched_timings = fetch_worksheets(backend, store, key, revision, missing)
+    frames.update(fetched)
+    for name, t in fetched_timings.items():
+        timings[name] = SheetTiming(t.source, revision_seconds + t.fetch, t.parse)
+    return frames, timings
+
+
+def load_dashboard_sheets(backend, store, spec=DASHBOARD_SHEETS, max_workers=4, timeout=30):
+    """
+    스프레드시트별 로드를 스레드 풀에서 동시에 실행한다.
+    페이지 대기 시간은 가장 느린 스프레드시트 하나의 시간에 가까워진다.
+    timeout 초 안에 끝나지 않은 스프레드시트는 errors 에 기록하고 기다리지 않는다.
+    """
+    result = LoadResult()
+    start = time.perf_counter()
+
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sheet-loader")
+    try:
+        futures = {
+            executor.submit(load_spreadsheet, backend, store, key, worksheets): (key, worksheets)
+            for key, worksheets in spec.items()
+        }
+        done, not_done = wait(futures, timeout=timeout)
+
+        for future, (key, worksheets) in futures.items():
+            names = [name for name, _ in worksheets]
+            if future in not_done:
+                for name in names:
+                    result.errors[name] = f"{timeout}초 안에 응답이 없습니다."
+                continue
+            try:
+                frames, timings = future.result()
+            except Exception as e:
+                for name in names:
+                    result.errors[name] = str(e)
+                continue
+            result.frames.update(frames)
+            result.timings.update(timings)
+    finally:
+        # 시간 초과된 요청은 백그라운드에서 마저 끝나도록 두고 바로 반환
+        executor.shutdown(wait=False)
+
+    result.elapsed = time.perf_counter() - start
+    return result
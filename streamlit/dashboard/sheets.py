@@ -0,0 +1,97 @@
+# sheets.py
+# 종합 대시보드에서 사용하는 구글 시트 정보와 파싱 함수
+import pandas as pd
+
+from dashboard.schema import SheetSchema, apply_schema
+
+# 구글 스프레드시트 key
+COMPANY_SHEET_KEY = "1o1tptX_-9NEoitHwUTh-OZSqRTdqysSEgMcl6_JNSzY"
+SALES_SHEET_KEY = "1hrpu7fL5b7zQnwGwLTfq5tx3WtNJ-ZTeEiVWGhzbkx4"
+
+# 워크시트 이름
+COMPANY_SHEET = "[통합검색]업체정보"
+SALES_SHEET = "매출"
+EC_CATEGORY_SHEET = "EC전체 카테고리"
+MALL_CATEGORY_SHEET = "관리몰 카테고리"
+CATEGORY_SHEET = "카테고리별"
+
+
+# 시트별 컬럼 타입 (수집 시점에 한 번만 변환)
+COMPANY_SCHEMA = SheetSchema(
+    dates={"타사이전(접수일)": ("접수일_dt", "%y-%m-%d")},
+    categorical=("타사이전(현황)",),
+)
+SALES_SCHEMA = SheetSchema(numeric=("VIP", "TOP100", "전체"), month="해당월")
+CATEGORY_SCHEMA = SheetSchema(numeric_after_first=True, month_first=True)
+PLAIN_SCHEMA = SheetSchema()
+
+
+#####################################
+# 시트 값 -> DataFrame 파싱
+#####################################
+def dedup_columns(header):
+    """중복 컬럼명은 두 번째부터 _2, _3 ... 접미사를 붙인다"""
+    names = pd.Series(header, dtype=object)
+    counts = names.groupby(names, sort=False).cumcount() + 1
+    return names.where(counts == 1, names + "_" + counts.astype(str)).tolist()
+
+
+def frame_from_values(header, rows):
+    """
+    시트 값(행 끝 빈 셀이 잘린 ragged 행 목록) -> 문자열 DataFrame
+    행 단위 파이썬 루프 없이 값 행렬을 한 번에 만들고, 가장 긴 행에 맞춰 헤더를 늘린다.
+    """
+    body = pd.DataFrame(rows, dtype=object)
+    width = max(len(header), body.shape[1])
+    body = body.reindex(columns=range(width)).fillna("")
+    body.columns = dedup_columns(list(header) + [""] * (width - len(header)))
+    return body
+
+
+def parse_company_sheet(data):
+    """업체정보 시트 (1행은 제목, 2행이 헤더) -> 중복 컬럼명을 처리한 DataFrame"""
+    if len(data) < 3:
+        return None
+    return apply_schema(frame_from_values(data[1], data[2:]), COMPANY_SCHEMA)
+
+
+def parse_sales_sheet(data):
+    """매출 시트 (해당월, VIP, TOP100, 전체)"""
+    if len(data) < 2:
+        return None
+
+    # 헤더 처리 (1행이 헤더: ['해당월', 'VIP', 'TOP100', '전체'])
+    return apply_schema(frame_from_values(data[0], data[1:]), SALES_SCHEMA)
+
+
+def parse_category_sheet(data):
+    """EC전체 / 관리몰 카테고리 시트 (첫 번째 열은 날짜/기간, 나머지는 카테고리별 금액)"""
+    if len(data) < 2:
+        return None
+
+    # 숫자형 데이터 변환 (첫 번째 열은 날짜/기간 열이므로 제외)
+    return apply_schema(frame_from_values(data[0], data[1:]), CATEGORY_SCHEMA)
+
+
+def parse_plain_sheet(data):
+    """카테고리별 시트 등 변환 없이 헤더만 적용"""
+    if len(data) < 2:
+        return None
+    return apply_schema(frame_from_values(data[0], data[1:]), PLAIN_SCHEMA)
+
+
+# 스프레드시트별로 대시보드에 필요한 워크시트와 파서
+DASHBOARD_SHEETS = {
+    COMPANY_SHEET_KEY: [
+        (COMPANY_SHEET, parse_company_sheet),
+    ],
+    SALES_SHEET_KEY: [
+        (SALES_SHEET, parse_sales_sheet),
+        (EC_CATEGORY_SHEET, parse_category_sheet),
+        (MALL_CATEGORY_SHEET, parse_category_sheet),
+        (CATEGORY_SHEET, parse_plain_sheet),
+    ],
+}
+
+# 월 단위로 행이 뒤에 추가되기만 하는 시트 (증분 동기화 대상)
+APPEND_ONLY_SHEETS = {SALES_SHEET, EC_CATEGORY_SHEET, MALL_CATEGORY_SHEET}
@@ -0,0 +1,129 @@
+# snapshot_store.py
+# 구글 시트를 파싱한 결과를 로컬 Parquet 파일로 저장해 두는 스냅샷 저장소
+import hashlib
+import json
+import os
+import threading
+import time
+
+import pandas as pd
+
+from dashboard.schema import STRING_DTYPE
+
+# 파싱 결과 형식이 바뀌면 올려서 이전 스냅샷을 무시하게 한다
+FORMAT_VERSION = 3
+
+
+class SnapshotStore:
+    """
+    (스프레드시트 key, 워크시트 이름) 별로 파싱된 DataFrame을 Parquet 파일로 저장하고,
+    저장 당시의 Drive modifiedTime(리비전)을 함께 기록한다.
+    리비전이 같으면 디스크에서 바로 읽고, 달라졌을 때만 다시 내려받는다.
+    """
+
+    def __init__(self, root, revision_ttl=60):
+        self.root = root
+        # Drive 메타데이터 조회 결과를 잠시 재사용 (매 rerun 마다 HTTP 호출 방지)
+        self.revision_ttl = revision_ttl
+        self._revisions = {}
+        self._lock = threading.Lock()
+        os.makedirs(self.root, exist_ok=True)
+
+    # -----------------------------------------
+    # 경로 / 메타데이터
+    # -----------------------------------------
+    def _base_path(self, key, worksheet):
+        digest = hashlib.sha1(f"{key}/{worksheet}".encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.root, digest)
+
+    def read_meta(self, key, worksheet):
+        meta_path = self._base_path(key, worksheet) + ".json"
+        if not os.path.exists(meta_path):
+            return None
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if meta.get("format") != FORMAT_VERSION:
+            return None
+        return meta
+
+    def _read_frame(self, key, worksheet):
+        # 문자열 컬럼을 Arrow 문자열(string[pyarrow])로 복원
+        # (mode.string_storage 옵션은 프로세스 전역이라 여러 로드 스레드가 서로 되돌리므로 쓰지 않고 컬럼별로 변환)
+        df = pd.read_parquet(self._base_path(key, worksheet) + ".parquet")
+        strings = {
+            column: STRING_DTYPE
+            for column, dtype in df.dtypes.items()
+            if isinstance(dtype, pd.StringDtype) and dtype.storage != "pyarrow"
+        }
+        return df.astype(strings) if strings else df
+
+    # -----------------------------------------
+    # 리비전 조회
+    # -----------------------------------------
+    def revision(self, backend, key):
+        """스프레드시트의 Drive modifiedTime (revision_ttl 초 동안 재사용)"""
+        now = time.monotonic()
+        with self._lock:
+            cached = self._revisions.get(key)
+            if cached is not None and now - cached[1] < self.revision_ttl:
+                return cached[0]
+
+        revision = backend.revision(key)
+        with self._lock:
+            self._revisions[key] = (revision, now)
+        return revision
+
+    # -----------------------------------------
+    # 읽기 / 쓰기
+    # -----------------------------------------
+    def load(self, key, worksheet, revision):
+        """저장된 리비전이 일치하면 DataFrame, 아니면 None"""
+        meta = self.read_meta(key, worksheet)
+        if meta is None or meta.get("revision") != revision:
+            return None
+        try:
+            return self._read_frame(key, worksheet)
+        except Exception as e:
+            print(f"스냅샷 읽기 오류 ({worksheet}): {e}")
+            return None
+
+    def load_latest(self, key, worksheet):
+        """
+        리비전과 상관없이 마지막으로 저장된 (DataFrame, 메타데이터), 없으면 None.
+        Parquet 과 메타데이터 교체 사이에 중단되어 행 수가 맞지 않으면 None (그 위에 행을 또 붙이지 않도록)
+        """
+        meta = self.read_meta(key, worksheet)
+        if meta is None:
+            return None
+        try:
+            df = self._read_frame(key, worksheet)
+        except Exception as e:
+            print(f"스냅샷 읽기 오류 ({worksheet}): {e}")
+            return None
+        if len(df) != meta.get("rows"):
+            return None
+        return df, meta
+
+    def save(self, key, worksheet, revision, df, extra=None):
+        """extra: 메타데이터에 함께 기록할 값 (증분 동기화 기준 등)"""
+        base = self._base_path(key, worksheet)
+        tmp_path = base + ".parquet.tmp"
+        df.to_parquet(tmp_path, index=None)
+        os.replace(tmp_path, base + ".parquet")
+
+        # extra 를 먼저 넣고 기본 항목으로 덮어쓴다 (extra 에 예전 revision / rows 가 섞여 있어도 이번 저장 값이 남도록)
+        meta = dict(extra or {})
+        meta.update({
+            "format": FORMAT_VERSION,
+            "spreadsheet": key,
+            "worksheet": worksheet,
+            "revision": revision,
+            "rows": len(df),
+            "saved_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        })
+        with open(base + ".json.tmp", "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(base + ".json.tmp", base + ".json")
@@ -0,0 +1,96 @@
+# transfer.py
+# 타사이전 지표: 업체정보를 접수일 순으로 한 번 정렬해 두고, 기간 선택은 이진 탐색 slice 로 처리
+# 카드 / 월별 건수는 월 x 현황 건수 행렬의 누적합으로 계산
+import numpy as np
+import pandas as pd
+
+DATE_COL = "접수일_dt"
+RECEIVED_COL = "타사이전(접수일)"
+STATUS_COL = "타사이전(현황)"
+MONTH_COL = "YearMonth"
+
+# 카드에 표시하는 현황 값 (KPI제외 카드는 현황이 비어 있지 않은 모든 행)
+STATUS_CARDS = ["방어중", "이전확정", "이전완료"]
+
+# 월별 차트의 건수 (접수일이 있는 모든 행)
+ROWS = "건수"
+
+
+def _month_code(year, month):
+    """연월 -> 1월 단위 정수 (월 축 위치 계산용)"""
+    return np.asarray(year) * 12 + np.asarray(month) - 1
+
+
+def _non_blank(series):
+    """문자열 / category 컬럼에서 공백을 빼고 비어 있지 않은 행 (category 는 범주 값만 한 번 검사)"""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        filled = np.asarray(series.cat.categories.astype(str).str.strip() != "")
+        codes = series.cat.codes.to_numpy()
+        return np.where(codes >= 0, filled[codes], False)
+    return series.fillna("").astype(str).str.strip().ne("").to_numpy()
+
+
+class TransferIndex:
+    """
+    업체정보 DataFrame -> 접수일이 있는 행만 접수일 오름차순으로 정렬한 사본 (데이터 버전마다 한 번)
+    기간 선택은 정렬된 날짜 배열에 searchsorted 두 번 -> 행 slice (미리보기 표용) 이고,
+    카드와 월별 건수는 월 x 카드 건수 행렬(cube)과 월 방향 누적합(prefix)에서 뺄셈 한 번으로 구한다.
+    """
+
+    def __init__(self, df):
+        frame = df[df[DATE_COL].notna()].sort_values(DATE_COL, kind="stable")
+        self.frame = frame.assign(**{MONTH_COL: frame[DATE_COL].dt.strftime("%Y-%m")})
+        self.dates = frame[DATE_COL].to_numpy(dtype="datetime64[ns]")
+
+        # 행별 집계 플래그
+        status = frame[STATUS_COL]
+        self.flags = {"총 발생수": _non_blank(frame[RECEIVED_COL])}
+        for value in STATUS_CARDS:
+            self.flags[value] = (status == value).to_numpy()
+        self.flags["KPI제외"] = _non_blank(status)
+        self.flags[ROWS] = np.ones(len(frame), dtype=bool)
+        self._build_cube(frame[DATE_COL])
+
+    def _build_cube(self, dates):
+        """첫 접수월 ~ 마지막 접수월의 월 x 카드 건수 행렬과 누적합 (빈 월은 0 행)"""
+        self.cards = list(self.flags)
+        codes = _month_code(dates.dt.year.to_numpy(), dates.dt.month.to_numpy())
+        self.first_code = int(codes[0]) if len(codes) else 0
+        size = int(codes[-1]) - self.first_code + 1 if len(codes) else 0
+        positions = codes - self.first_code
+        self.cube = np.zeros((size, len(self.cards)), dtype="int64")
+        for i, card in enumerate(self.cards):
+            self.cube[:, i] = np.bincount(positions, weights=self.flags[card], minlength=size)
+        self.prefix = np.vstack([np.zeros((1, len(self.cards)), dtype="int64"), np.cumsum(self.cube, axis=0)])
+
+    def _month_position(self, month):
+        """'YYYY-MM' -> 월 축 위치 (범위 밖이어도 그대로, 호출하는 쪽에서 자른다)"""
+        period = pd.Period(month, freq="M")
+        return int(_month_code(period.year, period.month)) - self.first_code
+
+    def period_slice(self, start, end):
+        """start 이상, end 이하 (Timestamp) 인 행의 slice"""
+        lo = np.searchsorted(self.dates, np.datetime64(start, "ns"), side="left")
+        hi = np.searchsorted(self.dates, np.datetime64(end, "ns"), side="right")
+        return slice(int(lo), int(hi))
+
+    def rows(self, period):
+        """기간 slice 에 해당하는 정렬된 행 (YearMonth 컬럼 포함)"""
+        return self.frame.iloc[period]
+
+    def counts(self, start_month, end_month):
+        """start_month ~ end_month ('YYYY-MM', 양 끝 포함) 카드 집계: {카드 이름: 건수}"""
+        size = len(self.cube)
+        lo = min(max(self._month_position(start_month), 0), size)
+        hi = min(max(self._month_position(end_month) + 1, lo), size)
+        totals = self.prefix[hi] - self.prefix[lo]
+        return dict(zip(self.cards, totals.tolist()))
+
+    def monthly_counts(self, month_range, card=ROWS):
+        """month_range('YYYY-MM' 목록) 의 월별 card 건수 (자료가 없는 월은 0)"""
+        months = pd.PeriodIndex(month_range, freq="M")
+        positions = _month_code(months.year, months.month) - self.first_code
+        inside = (positions >= 0) & (positions < len(self.cube))
+        values = np.zeros(len(months), dtype="int64")
+        values[inside] = self.cube[positions[inside], self.cards.index(card)]
+        return pd.Series(values, index=list(month_range))
@@ -0,0 +1,6 @@
+# conftest.py
+# streamlit 폴더를 import 경로에 넣어 앱과 같은 방식(import dashboard.x)으로 모듈을 불러온다
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,93 @@
+# test_dataset.py
+# DatasetRefresher 가 증분으로 받은 행도 새 버전으로 내보내는지, 계측 기록 실패나 첫 로드 실패 뒤에도 버전을 내보내는지 확인
+import copy
+import threading
+import time
+
+from dashboard import sheet_loader, sheets
+from dashboard.dataset import DatasetRefresher
+from dashboard.fake_backend import FakeSheetsBackend, synthetic_spreadsheets
+from dashboard.perf_trace import TraceWriter
+from dashboard.snapshot_store import SnapshotStore
+
+KEY = sheets.SALES_SHEET_KEY
+SPEC = {KEY: [(sheets.SALES_SHEET, sheets.parse_sales_sheet)]}
+
+
+def test_incremental_rows_publish_a_new_version(tmp_path):
+    values = copy.deepcopy(synthetic_spreadsheets(company_rows=10)[KEY][sheets.SALES_SHEET])
+    backend = FakeSheetsBackend({KEY: {sheets.SALES_SHEET: values}})
+    store = SnapshotStore(str(tmp_path), revision_ttl=0)
+    refresher = DatasetRefresher(lambda: sheet_loader.load_dashboard_sheets(backend, store, spec=SPEC))
+
+    # 백그라운드 스레드 없이 갱신 한 번씩 직접 실행
+    refresher._refresh_once()
+    first = refresher.current()
+    assert first.version == 1
+
+    backend.update_worksheet(KEY, sheets.SALES_SHEET, values + [["2099-01", "1", "2", "3"]])
+    refresher._refresh_once()
+    second = refresher.current()
+    assert second.timings[sheets.SALES_SHEET].source == "incremental"
+    assert second.version == 2
+    assert len(second.get(sheets.SALES_SHEET)) == len(first.get(sheets.SALES_SHEET)) + 1
+
+    # 바뀐 것이 없으면 버전을 올리지 않는다
+    refresher._refresh_once()
+    assert refresher.current().version == 2
+
+
+def test_unwritable_trace_file_does_not_block_publishing(tmp_path):
+    values = synthetic_spreadsheets(company_rows=10)[KEY][sheets.SALES_SHEET]
+    backend = FakeSheetsBackend({KEY: {sheets.SALES_SHEET: values}})
+    store = SnapshotStore(str(tmp_path), revision_ttl=0)
+    writer = TraceWriter(str(tmp_path / "missing" / "perf_trace.jsonl"))
+    refresher = DatasetRefresher(
+        lambda: sheet_loader.load_dashboard_sheets(backend, store, spec=SPEC),
+        on_load=writer.write_load,
+    )
+
+    refresher._refresh_once()
+    assert writer.failed
+    assert refresher.current().version == 1
+
+
+def test_trace_file_is_rotated_past_max_bytes(tmp_path):
+    path = tmp_path / "perf_trace.jsonl"
+    writer = TraceWriter(str(path), max_bytes=100)
+    for seq in range(10):
+        writer.write({"seq": seq, "spans": []})
+
+    assert path.stat().st_size <= 100 + len('{"seq": 9, "spans": []}\n')
+    assert (tmp_path / "perf_trace.jsonl.1").exists()
+
+
+def test_failed_first_load_returns_quickly_and_retries(tmp_path):
+    values = synthetic_spreadsheets(company_rows=10)[KEY][sheets.SALES_SHEET]
+    backend = FakeSheetsBackend({KEY: {sheets.SALES_SHEET: values}})
+    store = SnapshotStore(str(tmp_path), revision_ttl=0)
+    attempts = []
+    release = threading.Event()
+
+    def load():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("인증 실패")
+        release.wait(5)
+        return sheet_loader.load_dashboard_sheets(backend, store, spec=SPEC)
+
+    refresher = DatasetRefresher(load, interval=300, retry_delay=0.05).start()
+
+    # 첫 로드가 실패하면 rerun 은 timeout 을 다 기다리지 않고 오류를 받는다
+    started = time.monotonic()
+    assert refresher.current(timeout=5) is None
+    assert time.monotonic() - started < 1
+    assert refresher.last_error == "인증 실패"
+
+    # interval(300초)이 아니라 retry_delay 뒤에 다시 시도해 첫 버전을 내보낸다
+    release.set()
+    deadline = time.monotonic() + 5
+    while refresher.current() is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert refresher.current().version == 1
+    assert refresher.last_error is None
@@ -0,0 +1,34 @@
+# test_formatting.py
+# 조/억 단위 금액 문자열 (음수 포함)과 Plotly 축 눈금
+import numpy as np
+import plotly.express as px
+
+from dashboard.formatting import EOK, apply_currency_format, currency_ticks, format_won
+
+
+def test_negative_amounts_use_jo_like_positive_ones():
+    assert format_won(1.5e12) == "1조 5,000억"
+    assert format_won(-1.5e12) == "-1조 5,000억"
+    assert format_won(-2e12) == "-2조"
+    assert format_won(-3 * EOK) == "-3억"
+    assert format_won(np.array([-1.2e12, np.nan, 5e11]), na="-").tolist() == ["-1조 2,000억", "-", "5,000억"]
+
+
+def test_currency_ticks_over_negative_range():
+    _, labels = currency_ticks(-2e12, 1e12)
+    assert labels == ["-2조", "-1조", "0억", "1조"]
+
+
+def test_single_value_gets_ticks_around_it():
+    tickvals, labels = currency_ticks(3e12, 3e12)
+    assert min(tickvals) < 3e12 < max(tickvals)
+    assert "3조" in labels
+
+
+def test_axis_keeps_labels_for_one_point_series():
+    fig = apply_currency_format(px.line(x=["2025-01"], y=[3e12]))
+    assert len(fig.layout.yaxis.tickvals) > 0
+
+    # 눈금을 만들 수 없으면 축 설정을 건드리지 않는다
+    fig = apply_currency_format(px.line(x=["2025-01"], y=[float("nan")]))
+    assert fig.layout.yaxis.tickmode is None
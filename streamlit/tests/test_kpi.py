@@ -0,0 +1,66 @@
+# test_kpi.py
+# 달력 기준 전월 / 전년 동월 증감과 카테고리 비중 표
+import numpy as np
+import pandas as pd
+import pytest
+
+from dashboard import kpi
+
+
+def sales_frame(months, vip, top100):
+    return pd.DataFrame({kpi.MONTH_COL: months, "VIP": vip, "TOP100": top100, "전체": np.add(vip, top100) * 2})
+
+
+def test_missing_month_leaves_mom_empty_but_keeps_yoy():
+    # 2025-02 가 빠진 시트: 행 위치(iloc[-2], iloc[-13])로 비교하면 어긋나는 경우
+    months = [f"2024-{m:02d}" for m in range(1, 13)] + ["2025-01", "2025-03"]
+    vip = [100 + i for i in range(14)]
+    table = kpi.kpi_table(sales_frame(months, vip, [10] * 14))
+
+    march = table.loc[pd.Period("2025-03", "M")]
+    assert np.isnan(march[("VIP", "mom")])
+    assert np.isnan(march[("VIP", "mom_pct")])
+    assert march[("VIP", "yoy")] == 113 - 102
+    assert march[("VIP", "yoy_pct")] == pytest.approx((113 - 102) / 102 * 100)
+
+    # 빠진 월은 표에 끼워 넣지 않는다
+    assert pd.Period("2025-02", "M") not in table.index
+    assert table.loc[pd.Period("2025-01", "M"), ("VIP", "mom")] == 112 - 111
+
+
+def test_zero_base_gives_empty_percentage():
+    table = kpi.kpi_table(sales_frame(["2025-01", "2025-02"], [0, 50], [5, 5]))
+    february = table.loc[pd.Period("2025-02", "M")]
+    assert february[("VIP", "mom")] == 50
+    assert np.isnan(february[("VIP", "mom_pct")])
+    assert february[("TOP100", "mom_pct")] == 0
+
+
+def test_derived_managed_mall_is_vip_plus_top100():
+    table = kpi.kpi_table(sales_frame(["2025-01", "2025-02"], [100, 130], [20, 30]))
+    february = table.loc[pd.Period("2025-02", "M")]
+    assert february[("관리몰", "value")] == 160
+    assert february[("관리몰", "mom")] == 40
+    assert february[("관리몰", "mom_pct")] == pytest.approx(40 / 120 * 100)
+
+
+def test_category_table_share_and_total():
+    df = pd.DataFrame({
+        "해당월": ["2025-01", "2025-02"],
+        "패션": [30, 60],
+        "뷰티": [70, np.nan],
+    })
+    table = kpi.category_table(df)
+
+    january = table.loc[pd.Period("2025-01", "M")]
+    assert january[("패션", "share")] == pytest.approx(30)
+    assert january[("뷰티", "share")] == pytest.approx(70)
+    assert january[(kpi.CATEGORY_TOTAL, "value")] == 100
+    assert (kpi.CATEGORY_TOTAL, "share") not in table.columns
+
+    # 결측 카테고리는 합계에서 빠지고, 비중도 NaN
+    february = table.loc[pd.Period("2025-02", "M")]
+    assert february[(kpi.CATEGORY_TOTAL, "value")] == 60
+    assert february[(kpi.CATEGORY_TOTAL, "mom")] == -40
+    assert february[("패션", "share")] == pytest.approx(100)
+    assert np.isnan(february[("뷰티", "share")])
@@ -0,0 +1,106 @@
+# test_sheet_loader.py
+# 가짜 시트 백엔드로 append-only 시트의 스냅샷 / 증분 동기화를 오프라인에서 확인
+import copy
+import time
+
+import pytest
+
+from dashboard import sheet_loader, sheets
+from dashboard.backend import BackendError
+from dashboard.fake_backend import FakeSheetsBackend, synthetic_spreadsheets
+from dashboard.snapshot_store import SnapshotStore
+
+KEY = sheets.SALES_SHEET_KEY
+SPEC = {KEY: [(sheets.SALES_SHEET, sheets.parse_sales_sheet)]}
+
+
+@pytest.fixture
+def backend():
+    data = synthetic_spreadsheets(company_rows=10)
+    return FakeSheetsBackend({KEY: {sheets.SALES_SHEET: copy.deepcopy(data[KEY][sheets.SALES_SHEET])}})
+
+
+@pytest.fixture
+def store(tmp_path):
+    # 리비전 조회를 캐시하지 않아야 update_worksheet 직후의 리비전이 바로 보인다
+    return SnapshotStore(str(tmp_path), revision_ttl=0)
+
+
+def load(backend, store):
+    result = sheet_loader.load_dashboard_sheets(backend, store, spec=SPEC)
+    assert not result.errors
+    return result.frames[sheets.SALES_SHEET], result.timings[sheets.SALES_SHEET].source
+
+
+def batch_gets(backend):
+    return sum(1 for request in backend.requests if request[0] == "batch_get")
+
+
+def edited(values, row, column, value):
+    values = copy.deepcopy(values)
+    values[row][column] = value
+    return values
+
+
+def test_snapshot_is_reused_after_revision_change_without_new_rows(backend, store):
+    load(backend, store)
+
+    # 앞쪽 행만 고쳐서 리비전만 바뀜 -> 새 행이 없는 증분 로드
+    values = backend.spreadsheets[KEY][sheets.SALES_SHEET]
+    backend.update_worksheet(KEY, sheets.SALES_SHEET, edited(values, 1, 1, "1"))
+    _, source = load(backend, store)
+    assert source == "incremental"
+
+    # 같은 리비전이면 스냅샷에서 읽고 batchGet 을 보내지 않는다
+    before = batch_gets(backend)
+    _, source = load(backend, store)
+    assert source == "snapshot"
+    assert batch_gets(backend) == before
+
+
+def test_stale_snapshot_is_fully_resynced(backend, store, monkeypatch):
+    load(backend, store)
+
+    # 같은 리비전 안에서 앞쪽 행 수정 + 새 행 추가 -> 증분 로드는 새 행만 반영
+    values = edited(backend.spreadsheets[KEY][sheets.SALES_SHEET], 1, 1, "123")
+    values.append(["2099-01", "1", "2", "3"])
+    backend.update_worksheet(KEY, sheets.SALES_SHEET, values)
+    df, source = load(backend, store)
+    assert source == "incremental"
+    assert df["VIP"].iloc[0] != 123
+
+    df, source = load(backend, store)
+    assert source == "snapshot"
+
+    # 리비전이 그대로여도 FULL_SYNC_INTERVAL 이 지나면 전체를 다시 받아 앞쪽 수정을 반영
+    now = time.time()
+    monkeypatch.setattr(sheet_loader.time, "time", lambda: now + 3 * 24 * 60 * 60)
+    df, source = load(backend, store)
+    assert source == "network"
+    assert df["VIP"].iloc[0] == 123
+    assert len(df) == len(values) - 1
+
+
+def test_torn_snapshot_is_not_used_for_appending(backend, store):
+    df, _ = load(backend, store)
+
+    # Parquet 만 새로 바뀌고 메타데이터 교체 전에 중단된 상태
+    base = store._base_path(KEY, sheets.SALES_SHEET)
+    df.iloc[:-1].to_parquet(base + ".parquet", index=None)
+    assert store.load_latest(KEY, sheets.SALES_SHEET) is None
+
+
+def test_incremental_ranges_stay_inside_the_grid(backend, store):
+    load(backend, store)
+    values = backend.spreadsheets[KEY][sheets.SALES_SHEET]
+    backend.update_worksheet(KEY, sheets.SALES_SHEET, values + [["2099-01", "1", "2", "3"]])
+    df, source = load(backend, store)
+    assert source == "incremental"
+    assert df["VIP"].iloc[-1] == 1
+
+    # 꼬리 범위는 헤더의 마지막 열(D)까지만 요청한다
+    ranges = [request[2] for request in backend.requests if request[0] == "batch_get"][-1]
+    assert ranges[-1].endswith(f"!A{len(values)}:D")
+    # 격자보다 넓은 범위는 실제 API 처럼 거부된다
+    with pytest.raises(BackendError):
+        backend.batch_get(KEY, [f"{sheet_loader.sheet_range(sheets.SALES_SHEET)}!A2:ZZZ"])
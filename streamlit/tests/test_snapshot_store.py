@@ -0,0 +1,37 @@
+# test_snapshot_store.py
+# 스냅샷을 여러 스레드에서 동시에 읽어도 컬럼 타입이 저장 당시와 같은지 확인
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+from dashboard import sheets
+from dashboard.fake_backend import synthetic_spreadsheets
+from dashboard.snapshot_store import SnapshotStore
+
+
+@pytest.fixture
+def saved(tmp_path):
+    store = SnapshotStore(str(tmp_path))
+    data = synthetic_spreadsheets(company_rows=50)
+    frames = {}
+    for key, worksheets in sheets.DASHBOARD_SHEETS.items():
+        for name, parse in worksheets:
+            df = parse(data[key][name])
+            store.save(key, name, "r1", df)
+            frames[(key, name)] = df
+    return store, frames
+
+
+def test_concurrent_reads_keep_string_dtypes(saved):
+    store, frames = saved
+    storage = pd.get_option("mode.string_storage")
+    jobs = list(frames) * 20
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        loaded = list(executor.map(lambda job: store.load(job[0], job[1], "r1"), jobs))
+
+    for job, df in zip(jobs, loaded):
+        assert df.dtypes.to_dict() == frames[job].dtypes.to_dict(), job[1]
+    # 전역 pandas 옵션은 건드리지 않는다
+    assert pd.get_option("mode.string_storage") == storage
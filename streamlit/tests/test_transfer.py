@@ -0,0 +1,71 @@
+# test_transfer.py
+# 월 x 현황 누적합(cube)으로 센 타사이전 건수가 pandas 필터로 센 건수와 같은지 확인
+import pandas as pd
+import pytest
+
+from dashboard import sheets
+from dashboard.fake_backend import synthetic_spreadsheets
+from dashboard.transfer import DATE_COL, RECEIVED_COL, ROWS, STATUS_CARDS, STATUS_COL, TransferIndex
+
+
+@pytest.fixture(scope="module")
+def company():
+    values = synthetic_spreadsheets(company_rows=3000)[sheets.COMPANY_SHEET_KEY][sheets.COMPANY_SHEET]
+    return sheets.parse_company_sheet(values)
+
+
+def filtered_counts(df, start_month, end_month):
+    """기존 방식: 기간 행을 불리언 마스크로 고른 뒤 카드별로 센다"""
+    months = df[DATE_COL].dt.strftime("%Y-%m")
+    rows = df[df[DATE_COL].notna() & (months >= start_month) & (months <= end_month)]
+    status = rows[STATUS_COL].astype(str).str.strip()
+    counts = {"총 발생수": int(rows[RECEIVED_COL].fillna("").astype(str).str.strip().ne("").sum())}
+    for value in STATUS_CARDS:
+        counts[value] = int((status == value).sum())
+    counts["KPI제외"] = int((rows[STATUS_COL].notna() & status.ne("")).sum())
+    counts[ROWS] = len(rows)
+    return counts
+
+
+def test_counts_match_pandas_filter(company):
+    index = TransferIndex(company)
+    first = company[DATE_COL].min().strftime("%Y-%m")
+    last = company[DATE_COL].max().strftime("%Y-%m")
+    middle = company[DATE_COL].quantile(0.5).strftime("%Y-%m")
+
+    for start, end in [(first, last), (first, middle), (middle, last), (middle, middle)]:
+        assert index.counts(start, end) == filtered_counts(company, start, end), (start, end)
+
+
+def test_counts_for_reversed_and_outside_ranges(company):
+    index = TransferIndex(company)
+    empty = dict.fromkeys(index.cards, 0)
+    first = company[DATE_COL].min().strftime("%Y-%m")
+    last = company[DATE_COL].max().strftime("%Y-%m")
+
+    assert index.counts(last, first) == empty
+    assert index.counts("1990-01", "1990-12") == empty
+    assert index.counts("2999-01", "2999-12") == empty
+    # 데이터보다 넓은 범위는 전체와 같다
+    assert index.counts("1990-01", "2999-12") == filtered_counts(company, first, last)
+
+
+def test_monthly_counts_match_pandas_filter(company):
+    index = TransferIndex(company)
+    months = pd.period_range(company[DATE_COL].min() - pd.DateOffset(months=2), company[DATE_COL].max(), freq="M")
+    month_range = [str(month) for month in months]
+
+    expected = company[DATE_COL].dropna().dt.strftime("%Y-%m").value_counts()
+    expected = expected.reindex(month_range, fill_value=0)
+    pd.testing.assert_series_equal(index.monthly_counts(month_range), expected, check_names=False, check_dtype=False)
+
+    status = company[STATUS_COL].astype(str)
+    done = company.loc[status == "이전완료", DATE_COL].dropna().dt.strftime("%Y-%m").value_counts()
+    assert index.monthly_counts(month_range, "이전완료").tolist() == done.reindex(month_range, fill_value=0).tolist()
+
+
+def test_frame_without_dated_rows(company):
+    index = TransferIndex(company.assign(**{DATE_COL: pd.NaT}))
+    assert len(index.frame) == 0
+    assert index.counts("2024-01", "2025-12") == dict.fromkeys(index.cards, 0)
+    assert index.monthly_counts(["2025-01", "2025-02"]).tolist() == [0, 0]
@@ -1,12 +1,34 @@
 # utils.py
+import hashlib
+import os
+from functools import lru_cache
+
 import streamlit as st
 
+# 앱 옆의 static 폴더 (server.enableStaticServing 으로 app/static/ 경로에도 노출됨)
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+
+
+@lru_cache(maxsize=None)
+def load_css(*names):
+    """static 폴더의 CSS 파일들을 이어 붙인 내용과 내용 해시(버전) - 프로세스에서 한 번만 읽는다"""
+    parts = []
+    for name in names:
+        with open(os.path.join(STATIC_DIR, name), encoding="utf-8") as f:
+            parts.append(f.read())
+    css = "\n".join(parts)
+    return css, hashlib.sha1(css.encode("utf-8")).hexdigest()[:10]
+
+
+def inject_css(*names):
+    """
+    CSS 파일들을 <style> 하나로 주입한다.
+    Streamlit 정적 서빙은 .css 를 text/plain + nosniff 로 보내 <link> 로는 적용되지 않으므로 인라인으로 넣되,
+    rerun 마다 내용이 같아서 두 번째 rerun 부터는 메시지 캐시의 해시 참조만 전송된다.
+    """
+    css, version = load_css(*names)
+    st.markdown(f'<style data-css-version="{version}">\n{css}\n</style>', unsafe_allow_html=True)
+
+
 def hide_sidebar_pages():
-    st.markdown("""
-    <style>
-    [data-testid="stSidebarNav"] {
-        display: none;
-    }
-    </style>
-    """, unsafe_allow_html=True)
-                                                         
\ No newline at end of file
+    inject_css("sidebar.css")